@@ -28,6 +28,16 @@ BOARD_PIXEL_SIZE = 8 * 80
 BOARD_OFFSET_X = 0        # left margin for centering board
 BOARD_OFFSET_Y = 0        # top margin for centering board
 
+# Pre-rendered checkerboard background, rebuilt by update_layout()
+BOARD_BG_SURFACE = None
+
+# Per-square screen geometry indexed by chess.Square, rebuilt by update_layout()
+SQUARE_RECTS = [None] * 64
+SQUARE_CENTERS = [None] * 64
+
+# Pre-rendered legal-target dot sprite, rebuilt by update_layout()
+MOVE_DOT_SURFACE = None
+
 LIGHT_COLOR = (240, 217, 181)  # light squares
 DARK_COLOR = (181, 136, 99)    # dark squares
 HIGHLIGHT_COLOR = (186, 202, 68)  # for selected square
@@ -39,48 +49,164 @@ BUTTON_TEXT_COLOR = (255, 255, 255)   # white text on button
 
 PIECE_FONT_SIZE = 48
 
+# Square colors in screen order (rank-major, top-left first), so the board
+# background bake indexes a table instead of branching on parity per square
+SQUARE_COLORS = [
+    LIGHT_COLOR if (f + r) % 2 == 0 else DARK_COLOR
+    for r in range(BOARD_SIZE)
+    for f in range(BOARD_SIZE)
+]
+
+
+# --- Text rendering cache ---
+# Font rendering via SDL_ttf is expensive; the status/indicator strings only
+# change on state transitions, so cache the rendered surfaces by content.
+_TEXT_CACHE = {}
+
+
+def render_text(font, text: str, color=TEXT_COLOR) -> pygame.Surface:
+    """Render text with the given font, caching the resulting surface.
+
+    Keyed by (text, font identity, color) so the same string rendered with
+    different fonts or colors gets separate entries. The cache only ever
+    holds the handful of status/indicator strings the UI shows, so it is
+    never explicitly bounded.
+    """
+    key = (text, id(font), color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        # convert_alpha() matches the display format so the cached surface
+        # blits without per-pixel format conversion (antialiased text needs
+        # the alpha channel, so plain convert() is not an option here)
+        surface = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surface
+    return surface
+
 
 # --- Piece image loading ---
-PIECE_IMAGES = {}
+# All 12 piece images are packed into a single atlas surface so draw_board
+# can blit subrects of one texture instead of binding 12 separate surfaces.
+PIECE_ATLAS = None
+PIECE_RECTS = {}
 
+# Original unscaled piece surfaces, loaded from disk once; rescaling on
+# resize works from these instead of reloading the PNGs
+_ORIGINAL_PIECE_IMAGES = {}
+_LAST_SQUARE_SIZE = None
+
+# Cached (square, symbol) pairs for drawing; board.piece_map() scans all 64
+# squares and allocates a dict, so only rebuild it after the position changes
+_PIECE_CACHE = None
+
+# Ready-to-blit sequence derived from _PIECE_CACHE for screen.blits(); also
+# dropped when the layout or atlas changes since it bakes in screen positions
+_PIECE_BLIT_SEQ = None
+
+
+def invalidate_piece_cache() -> None:
+    """Drop the cached piece list; call after any move push or board reset."""
+    global _PIECE_CACHE, _PIECE_BLIT_SEQ
+    _PIECE_CACHE = None
+    _PIECE_BLIT_SEQ = None
 
-def load_piece_images(square_size: int) -> None:
-    """Load and scale PNG images for each chess piece.
+
+# Cached game-over info, refreshed only when the position changes.
+# None while the game is running; otherwise a (message, termination) pair of
+# ready-to-draw strings. Saves re-running python-chess's checkmate/stalemate
+# detection on every loop iteration.
+GAME_OVER_STATE = None
+
+
+def refresh_game_over_state(board: chess.Board) -> None:
+    """Recompute the cached game-over strings; call after any position change."""
+    global GAME_OVER_STATE
+
+    outcome = board.outcome()
+    if outcome is None:
+        GAME_OVER_STATE = None
+        return
+
+    result = outcome.result()
+    if result == "1-0":
+        message = "White Wins!"
+    elif result == "0-1":
+        message = "Black Wins!"
+    else:
+        message = "Draw!"
+
+    termination = outcome.termination.name.replace("_", " ").title()
+    GAME_OVER_STATE = (message, f"({termination})")
+
+PIECE_FILENAMES = {
+    "P": "w_pawn.png",
+    "N": "w_knight.png",
+    "B": "w_bishop.png",
+    "R": "w_rook.png",
+    "Q": "w_queen.png",
+    "K": "w_king.png",
+    "p": "b_pawn.png",
+    "n": "b_knight.png",
+    "b": "b_bishop.png",
+    "r": "b_rook.png",
+    "q": "b_queen.png",
+    "k": "b_king.png",
+}
+
+
+def _load_original_piece_images() -> None:
+    """Load the unscaled PNG image for each chess piece from disk, once.
 
     Expected filenames (already present in asset/set_X):
       - b_bishop.png, b_king.png, b_knight.png, b_pawn.png, b_queen.png, b_rook.png
       - w_bishop.png, w_king.png, w_knight.png, w_pawn.png, w_queen.png, w_rook.png
     """
-    global PIECE_IMAGES
-
     # Determine the path to the assets directory relative to this file
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     asset_dir = os.path.join(base_dir, "asset", f"set_{PIECE_SET_NUMBER}")
 
-    mapping = {
-        "P": "w_pawn.png",
-        "N": "w_knight.png",
-        "B": "w_bishop.png",
-        "R": "w_rook.png",
-        "Q": "w_queen.png",
-        "K": "w_king.png",
-        "p": "b_pawn.png",
-        "n": "b_knight.png",
-        "b": "b_bishop.png",
-        "r": "b_rook.png",
-        "q": "b_queen.png",
-        "k": "b_king.png",
-    }
-
-    PIECE_IMAGES = {}
-    for symbol, filename in mapping.items():
+    for symbol, filename in PIECE_FILENAMES.items():
         path = os.path.join(asset_dir, filename)
         if not os.path.exists(path):
             # If something is missing, skip instead of crashing
             continue
-        image = pygame.image.load(path).convert_alpha()
-        image = pygame.transform.smoothscale(image, (square_size, square_size))
-        PIECE_IMAGES[symbol] = image
+        _ORIGINAL_PIECE_IMAGES[symbol] = pygame.image.load(path).convert_alpha()
+
+
+def load_piece_images(square_size: int) -> None:
+    """Scale the cached piece images to square_size and pack them into an atlas.
+
+    The images are packed into a 6x2 grid on PIECE_ATLAS (white pieces on the
+    top row, black on the bottom), with PIECE_RECTS mapping each piece symbol
+    to its source rect within the atlas. Originals are read from disk only on
+    the first call; subsequent calls just rescale, and calls with an unchanged
+    square_size (e.g. resize events that keep the board height) are no-ops.
+    """
+    global PIECE_ATLAS, PIECE_RECTS, _LAST_SQUARE_SIZE, _PIECE_BLIT_SEQ
+
+    if square_size == _LAST_SQUARE_SIZE:
+        return
+    _LAST_SQUARE_SIZE = square_size
+    _PIECE_BLIT_SEQ = None  # cached blit entries reference the old atlas
+
+    if not _ORIGINAL_PIECE_IMAGES:
+        _load_original_piece_images()
+
+    PIECE_ATLAS = pygame.Surface(
+        (square_size * 6, square_size * 2), pygame.SRCALPHA
+    ).convert_alpha()
+    PIECE_RECTS = {}
+    for index, (symbol, original) in enumerate(_ORIGINAL_PIECE_IMAGES.items()):
+        image = pygame.transform.smoothscale(original, (square_size, square_size))
+
+        # Grid cell: columns are piece types, rows are white (0) / black (1)
+        cell = pygame.Rect(
+            (index % 6) * square_size,
+            (index // 6) * square_size,
+            square_size,
+            square_size,
+        )
+        PIECE_ATLAS.blit(image, cell)
+        PIECE_RECTS[symbol] = cell
 
 
 def update_layout(width: int, height: int) -> None:
@@ -91,6 +217,10 @@ def update_layout(width: int, height: int) -> None:
     - The board is centered horizontally and vertically, leaving margins.
     """
     global SQUARE_SIZE, BOARD_PIXEL_SIZE, BOARD_OFFSET_X, BOARD_OFFSET_Y
+    global BOARD_BG_SURFACE, MOVE_DOT_SURFACE, _PIECE_BLIT_SEQ
+
+    # Cached piece blit positions are relative to the old layout
+    _PIECE_BLIT_SEQ = None
 
     # Desired board side length based on height
     desired_board_side = int(height * BOARD_HEIGHT_RATIO)
@@ -103,30 +233,94 @@ def update_layout(width: int, height: int) -> None:
     BOARD_OFFSET_X = (width - BOARD_PIXEL_SIZE) // 2
     BOARD_OFFSET_Y = (height - BOARD_PIXEL_SIZE) // 2
 
+    # Pre-render the checkerboard once per layout change so draw_board can
+    # blit it in a single call instead of filling 64 rects every frame
+    BOARD_BG_SURFACE = pygame.Surface((BOARD_PIXEL_SIZE, BOARD_PIXEL_SIZE)).convert()
+    for rank in range(BOARD_SIZE):
+        for file in range(BOARD_SIZE):
+            rect = pygame.Rect(
+                file * SQUARE_SIZE,
+                rank * SQUARE_SIZE,
+                SQUARE_SIZE,
+                SQUARE_SIZE,
+            )
+            color = SQUARE_COLORS[rank * BOARD_SIZE + file]
+            pygame.draw.rect(BOARD_BG_SURFACE, color, rect)
+
+    # Precompute screen rects and centers per square so the draw loops can
+    # index them instead of redoing the offset arithmetic every frame
+    for square in chess.SQUARES:
+        f, r = square_to_coord(square)
+        rect = pygame.Rect(
+            BOARD_OFFSET_X + f * SQUARE_SIZE,
+            BOARD_OFFSET_Y + r * SQUARE_SIZE,
+            SQUARE_SIZE,
+            SQUARE_SIZE,
+        )
+        SQUARE_RECTS[square] = rect
+        SQUARE_CENTERS[square] = rect.center
+
+    # Pre-render the legal-target dot once per layout change; blitting it is
+    # cheaper than rasterizing a circle for every target square each frame
+    radius = max(SQUARE_SIZE // 6, 1)
+    MOVE_DOT_SURFACE = pygame.Surface(
+        (radius * 2, radius * 2), pygame.SRCALPHA
+    ).convert_alpha()
+    pygame.draw.circle(MOVE_DOT_SURFACE, MOVE_COLOR, (radius, radius), radius)
+
+
+# Player-type indicator surface, rendered once in init_pygame; BLACK_IS_AI
+# never changes at runtime so neither does the text
+PLAYER_INDICATOR_SURFACE = None
+
 
 def init_pygame():
+    global PLAYER_INDICATOR_SURFACE
+
     pygame.init()
+    # The display must exist before update_layout/load_piece_images run:
+    # their convert()/convert_alpha() calls need the display pixel format
     screen = pygame.display.set_mode(
         (DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE
     )
     update_layout(DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT)
     load_piece_images(SQUARE_SIZE)
     pygame.display.set_caption("EEG-Chess (mouse prototype)")
+
+    # Only let through the event types the main loop actually handles;
+    # blocking the rest (MOUSEMOTION floods in particular) avoids allocating
+    # Python event objects per tick. Hover detection uses
+    # pygame.mouse.get_pos(), which polls SDL's mouse state directly and
+    # keeps working with MOUSEMOTION blocked.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE, pygame.MOUSEBUTTONDOWN]
+    )
     font = pygame.font.SysFont("dejavusans", PIECE_FONT_SIZE)
     status_font = pygame.font.SysFont("dejavusans", 20)
+    build_restart_button_surfaces(status_font)
+    PLAYER_INDICATOR_SURFACE = render_text(
+        status_font, f"Black: {'AI' if BLACK_IS_AI else 'Human'}"
+    )
     return screen, font, status_font
 
 
+# Square-to-screen-coordinate lookup tables, built once at import time so the
+# conversions below are plain indexing instead of calls into python-chess
+SQ_TO_FILE = tuple(chess.square_file(sq) for sq in chess.SQUARES)
+SQ_TO_SCREEN_RANK = tuple(7 - chess.square_rank(sq) for sq in chess.SQUARES)
+
+
 def square_to_coord(square: chess.Square):
     """Convert a python-chess square index (0-63) to (file, rank) board coordinates (0-7, 0-7)."""
-    file = chess.square_file(square)
-    rank = 7 - chess.square_rank(square)  # invert y-axis for screen drawing
-    return file, rank
+    # Screen rank inverts the y-axis for drawing
+    return SQ_TO_FILE[square], SQ_TO_SCREEN_RANK[square]
 
 
 def coord_to_square(file: int, rank: int):
     """Convert (file, rank) board coordinates to a python-chess square index."""
-    return chess.square(file, 7 - rank)
+    # Same as chess.square(file, 7 - rank) without the function call
+    return file + ((7 - rank) << 3)
 
 
 def get_restart_button_rect(board_offset_x: int, board_offset_y: int) -> pygame.Rect:
@@ -138,36 +332,44 @@ def get_restart_button_rect(board_offset_x: int, board_offset_y: int) -> pygame.
     return pygame.Rect(button_x, button_y, button_width, button_height)
 
 
-def draw_game_over_prompt(screen, board: chess.Board, status_font):
-    """Draw game over message and restart button on the left side of the board."""
-    if not board.is_game_over():
-        return
-    
-    width, height = screen.get_size()
-    
-    # Determine game result message
-    outcome = board.outcome()
-    if outcome is None:
+# Pre-rendered restart button surfaces (normal and hover states), built once
+# in init_pygame; the button has a fixed size so no rebuild on resize
+RESTART_BTN_NORMAL = None
+RESTART_BTN_HOVER = None
+
+
+def build_restart_button_surfaces(status_font) -> None:
+    """Pre-render the restart button with its label in both hover states."""
+    global RESTART_BTN_NORMAL, RESTART_BTN_HOVER
+
+    size = get_restart_button_rect(0, 0).size
+    label = render_text(status_font, "Restart", BUTTON_TEXT_COLOR)
+
+    surfaces = []
+    for fill_color in (BUTTON_COLOR, BUTTON_HOVER_COLOR):
+        surface = pygame.Surface(size).convert()
+        surface.fill(fill_color)
+        pygame.draw.rect(surface, TEXT_COLOR, surface.get_rect(), 2)  # Border
+        surface.blit(label, label.get_rect(center=surface.get_rect().center))
+        surfaces.append(surface)
+    RESTART_BTN_NORMAL, RESTART_BTN_HOVER = surfaces
+
+
+def draw_game_over_prompt(screen, status_font):
+    """Draw game over message and restart button on the left side of the board.
+
+    Uses the strings cached in GAME_OVER_STATE by refresh_game_over_state()
+    rather than interrogating the board each frame.
+    """
+    if GAME_OVER_STATE is None:
         return
-    
-    result = board.result()
-    if result == "1-0":
-        message = "White Wins!"
-    elif result == "0-1":
-        message = "Black Wins!"
-    else:
-        message = "Draw!"
-    
-    termination = outcome.termination.name.replace("_", " ").title()
-    
-    # Draw game over text
-    game_over_text = f"Game Over"
-    result_text = message
-    termination_text = f"({termination})"
-    
-    game_over_surface = status_font.render(game_over_text, True, TEXT_COLOR)
-    result_surface = status_font.render(result_text, True, TEXT_COLOR)
-    termination_surface = status_font.render(termination_text, True, TEXT_COLOR)
+
+    result_text, termination_text = GAME_OVER_STATE
+    game_over_text = "Game Over"
+
+    game_over_surface = render_text(status_font, game_over_text)
+    result_surface = render_text(status_font, result_text)
+    termination_surface = render_text(status_font, termination_text)
     
     # Position on the left side of the board
     text_x = BOARD_OFFSET_X - max(
@@ -187,23 +389,15 @@ def draw_game_over_prompt(screen, board: chess.Board, status_font):
     # Check if mouse is hovering over button
     mouse_pos = pygame.mouse.get_pos()
     is_hover = button_rect.collidepoint(mouse_pos)
-    button_color = BUTTON_HOVER_COLOR if is_hover else BUTTON_COLOR
-    
-    pygame.draw.rect(screen, button_color, button_rect)
-    pygame.draw.rect(screen, TEXT_COLOR, button_rect, 2)  # Border
-    
-    # Button text
-    button_text = "Restart"
-    button_text_surface = status_font.render(button_text, True, BUTTON_TEXT_COLOR)
-    button_text_rect = button_text_surface.get_rect(center=button_rect.center)
-    screen.blit(button_text_surface, button_text_rect)
+
+    screen.blit(RESTART_BTN_HOVER if is_hover else RESTART_BTN_NORMAL, button_rect)
 
 
-def check_restart_button_click(mouse_pos, board: chess.Board) -> bool:
+def check_restart_button_click(mouse_pos) -> bool:
     """Check if the restart button was clicked. Returns True if clicked."""
-    if not board.is_game_over():
+    if GAME_OVER_STATE is None:
         return False
-    
+
     button_rect = get_restart_button_rect(BOARD_OFFSET_X, BOARD_OFFSET_Y)
     return button_rect.collidepoint(mouse_pos)
 
@@ -211,69 +405,56 @@ def check_restart_button_click(mouse_pos, board: chess.Board) -> bool:
 def reset_game(board: chess.Board) -> tuple:
     """Reset the game board and return cleared game state."""
     board.reset()
+    invalidate_piece_cache()
+    refresh_game_over_state(board)
     return None, []  # selected_square, legal_targets
 
 
 def draw_board(screen, board: chess.Board, font, status_font, selected_square, legal_targets):
     width, height = screen.get_size()
 
-    # Draw chessboard squares
-    for rank in range(BOARD_SIZE):
-        for file in range(BOARD_SIZE):
-            rect = pygame.Rect(
-                BOARD_OFFSET_X + file * SQUARE_SIZE,
-                BOARD_OFFSET_Y + rank * SQUARE_SIZE,
-                SQUARE_SIZE,
-                SQUARE_SIZE,
-            )
-            color = LIGHT_COLOR if (file + rank) % 2 == 0 else DARK_COLOR
-            pygame.draw.rect(screen, color, rect)
+    # Draw the pre-rendered chessboard background in one blit
+    screen.blit(BOARD_BG_SURFACE, (BOARD_OFFSET_X, BOARD_OFFSET_Y))
 
     # Highlight selected square
     if selected_square is not None:
-        f, r = square_to_coord(selected_square)
-        rect = pygame.Rect(
-            BOARD_OFFSET_X + f * SQUARE_SIZE,
-            BOARD_OFFSET_Y + r * SQUARE_SIZE,
-            SQUARE_SIZE,
-            SQUARE_SIZE,
-        )
-        pygame.draw.rect(screen, HIGHLIGHT_COLOR, rect, 5)
+        pygame.draw.rect(screen, HIGHLIGHT_COLOR, SQUARE_RECTS[selected_square], 5)
 
     # Highlight legal target squares
     for sq in legal_targets:
-        f, r = square_to_coord(sq)
-        center = (
-            BOARD_OFFSET_X + f * SQUARE_SIZE + SQUARE_SIZE // 2,
-            BOARD_OFFSET_Y + r * SQUARE_SIZE + SQUARE_SIZE // 2,
-        )
-        pygame.draw.circle(screen, MOVE_COLOR, center, SQUARE_SIZE // 6)
+        screen.blit(MOVE_DOT_SURFACE, MOVE_DOT_SURFACE.get_rect(center=SQUARE_CENTERS[sq]))
 
     # Draw pieces using images (fall back to Unicode if an image is missing)
-    for square, piece in board.piece_map().items():
-        f, r = square_to_coord(square)
-        center_x = BOARD_OFFSET_X + f * SQUARE_SIZE + SQUARE_SIZE // 2
-        center_y = BOARD_OFFSET_Y + r * SQUARE_SIZE + SQUARE_SIZE // 2
-        symbol = piece.symbol()  # 'P', 'p', 'K', etc.
-
-        image = PIECE_IMAGES.get(symbol)
-        if image is not None:
-            rect = image.get_rect(center=(center_x, center_y))
-            screen.blit(image, rect)
-        else:
-            # Fallback: Unicode character if no image loaded
-            text_surface = font.render(piece.unicode_symbol(), True, TEXT_COLOR)
-            text_rect = text_surface.get_rect(center=(center_x, center_y))
-            screen.blit(text_surface, text_rect)
-
-    # Draw player type indicator (Black: Human/AI)
-    player_indicator_text = f"Black: {'AI' if BLACK_IS_AI else 'Human'}"
-    player_indicator_surface = status_font.render(player_indicator_text, True, TEXT_COLOR)
-    
+    global _PIECE_CACHE, _PIECE_BLIT_SEQ
+    if _PIECE_CACHE is None:
+        _PIECE_CACHE = [(sq, p.symbol()) for sq, p in board.piece_map().items()]
+        _PIECE_BLIT_SEQ = None
+
+    if _PIECE_BLIT_SEQ is None:
+        _PIECE_BLIT_SEQ = []
+        for square, symbol in _PIECE_CACHE:
+            center = SQUARE_CENTERS[square]
+            piece_rect = PIECE_RECTS.get(symbol)
+            if piece_rect is not None:
+                dest_rect = piece_rect.copy()
+                dest_rect.center = center
+                _PIECE_BLIT_SEQ.append((PIECE_ATLAS, dest_rect, piece_rect))
+            else:
+                # Fallback: Unicode character if no image loaded
+                unicode_symbol = chess.Piece.from_symbol(symbol).unicode_symbol()
+                text_surface = render_text(font, unicode_symbol)
+                _PIECE_BLIT_SEQ.append(
+                    (text_surface, text_surface.get_rect(center=center))
+                )
+
+    # One C-level batched call instead of a Python blit per piece
+    screen.blits(_PIECE_BLIT_SEQ, doreturn=False)
+
+    # Draw player type indicator (Black: Human/AI), rendered once at init
     # Place indicator on the right side of the board, aligned with top
     indicator_x = BOARD_OFFSET_X + BOARD_PIXEL_SIZE + 10
     indicator_y = BOARD_OFFSET_Y + 5
-    screen.blit(player_indicator_surface, (indicator_x, indicator_y))
+    screen.blit(PLAYER_INDICATOR_SURFACE, (indicator_x, indicator_y))
 
     # Draw status text
     status_text = f"{'White' if board.turn == chess.WHITE else 'Black'} to move"
@@ -282,7 +463,7 @@ def draw_board(screen, board: chess.Board, font, status_font, selected_square, l
     if board.is_game_over():
         status_text = f"Game over: {board.result()} ({board.outcome().termination.name})"
 
-    status_surface = status_font.render(status_text, True, TEXT_COLOR)
+    status_surface = render_text(status_font, status_text)
 
     # Place status text below the board if there is room, otherwise near bottom
     status_x = 10
@@ -319,7 +500,12 @@ def handle_click(board: chess.Board, mouse_pos, selected_square):
     if selected_square is None:
         piece = board.piece_at(clicked_square)
         if piece is not None and piece.color == board.turn:
-            legal_targets = [m.to_square for m in board.legal_moves if m.from_square == clicked_square]
+            # from_mask restricts generation to the clicked square, so moves
+            # from other squares are never generated in the first place
+            legal_targets = [
+                m.to_square
+                for m in board.generate_legal_moves(from_mask=chess.BB_SQUARES[clicked_square])
+            ]
             return clicked_square, legal_targets, False
         # Invalid selection -> clear
         return None, [], False
@@ -341,14 +527,22 @@ def handle_click(board: chess.Board, mouse_pos, selected_square):
            (piece.color == chess.BLACK and target_rank == 0):
             move = chess.Move(selected_square, clicked_square, promotion=chess.QUEEN)
 
-    if move in board.legal_moves:
+    # is_legal tests the move directly on the bitboards instead of generating
+    # and searching the full legal-move list. Promotion moves need their
+    # promotion piece set for this to pass — the pawn branch above handles it.
+    if board.is_legal(move):
         board.push(move)
+        invalidate_piece_cache()
+        refresh_game_over_state(board)
         return None, [], True
 
     # If invalid target, treat click as trying to select a new piece
     piece = board.piece_at(clicked_square)
     if piece is not None and piece.color == board.turn:
-        legal_targets = [m.to_square for m in board.legal_moves if m.from_square == clicked_square]
+        legal_targets = [
+            m.to_square
+            for m in board.generate_legal_moves(from_mask=chess.BB_SQUARES[clicked_square])
+        ]
         return clicked_square, legal_targets, False
 
     return None, [], False
@@ -362,42 +556,73 @@ def main():
     selected_square = None
     legal_targets = []
 
+    # Only repaint when something visible changed; a turn-based UI spends
+    # most of its time waiting for input, so skip the draw+flip when clean
+    dirty = True
+    last_button_hover = False
+
     running = True
     while running:
-        for event in pygame.event.get():
+        events = pygame.event.get()
+
+        # Dragging a window edge fires a stream of VIDEORESIZE events per
+        # tick; only the final size matters, so coalesce and apply it once
+        # after the rest of the batch is handled
+        last_resize = next(
+            (e for e in reversed(events) if e.type == pygame.VIDEORESIZE), None
+        )
+
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 running = False
-            elif event.type == pygame.VIDEORESIZE:
-                # Window resized (including maximize) -> update layout to keep board centered
-                screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
-                update_layout(event.w, event.h)
-                load_piece_images(SQUARE_SIZE)
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # Check if restart button was clicked
-                if check_restart_button_click(pygame.mouse.get_pos(), board):
+                if check_restart_button_click(pygame.mouse.get_pos()):
                     selected_square, legal_targets = reset_game(board)
+                    dirty = True
                 # Only allow mouse-driven moves when it's a human's turn and game is not over
-                elif not board.is_game_over() and not (BLACK_IS_AI and board.turn == chess.BLACK):
+                elif GAME_OVER_STATE is None and not (BLACK_IS_AI and board.turn == chess.BLACK):
                     selected_square, legal_targets, _ = handle_click(
                         board, pygame.mouse.get_pos(), selected_square
                     )
+                    dirty = True
+
+        if last_resize is not None:
+            # Window resized (including maximize) -> update layout to keep board centered
+            screen = pygame.display.set_mode(last_resize.size, pygame.RESIZABLE)
+            update_layout(last_resize.w, last_resize.h)
+            load_piece_images(SQUARE_SIZE)
+            dirty = True
 
         # Simple AI for black: if enabled and it's black's turn, pick a random legal move
-        if BLACK_IS_AI and board.turn == chess.BLACK and not board.is_game_over():
+        if BLACK_IS_AI and board.turn == chess.BLACK and GAME_OVER_STATE is None:
             legal_moves = list(board.legal_moves)
             if legal_moves:
                 ai_move = random.choice(legal_moves)
                 board.push(ai_move)
+                invalidate_piece_cache()
+                refresh_game_over_state(board)
                 # Clear any human selection/highlights after AI move
                 selected_square = None
                 legal_targets = []
-
-        screen.fill((0, 0, 0))
-        draw_board(screen, board, font, status_font, selected_square, legal_targets)
-        draw_game_over_prompt(screen, board, status_font)
-        pygame.display.flip()
+                dirty = True
+
+        # The restart button changes color on hover, so repaint on transitions
+        if GAME_OVER_STATE is not None:
+            button_rect = get_restart_button_rect(BOARD_OFFSET_X, BOARD_OFFSET_Y)
+            is_hover = button_rect.collidepoint(pygame.mouse.get_pos())
+            if is_hover != last_button_hover:
+                last_button_hover = is_hover
+                dirty = True
+
+        if dirty:
+            screen.fill((0, 0, 0))
+            draw_board(screen, board, font, status_font, selected_square, legal_targets)
+            draw_game_over_prompt(screen, status_font)
+            pygame.display.flip()
+            dirty = False
         clock.tick(60)
 
     pygame.quit()